@@ -1,33 +1,78 @@
 from os import environ
-from flask import Flask, request, jsonify, Blueprint
-from marshmallow_mongoengine import ModelSchema, fields
+from datetime import timezone
+from collections import deque
+from threading import Lock, Timer
+from functools import lru_cache
+import atexit
+import hmac
+from flask import Flask, Response, request, jsonify, json, stream_with_context, Blueprint
+from flask.json.provider import DefaultJSONProvider
+from marshmallow_mongoengine import ModelSchema, convert_field, fields
 from marshmallow import validate, validates_schema, ValidationError
 import mongoengine as me
+import orjson
+from bson import ObjectId
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import BulkWriteError
+from cachetools import TTLCache
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        # naive datetimes come from pymongo and are UTC
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, ObjectId):
+            return str(o)
+        return DefaultJSONProvider.default(o)
 
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 routing_blueprint = Blueprint('routing', __name__, template_folder='templates')
 
 if 'MONGODB_DATABASE' not in environ:
     print("MONGODB_DATABASE not set, exiting...")
     exit(1)
 
+AUTH_PSK = environ.get('AUTH_PSK', 'defaultpsk').encode()
+API_ROOT = environ.get('API_ROOT', '')
+
+connection_settings = {
+    'host': environ.get('MONGODB_HOST', 'localhost'),
+    'port': int(environ.get('MONGODB_PORT', '27017')),
+    'maxPoolSize': int(environ.get('MONGODB_MAX_POOL_SIZE', '200')),
+    'minPoolSize': int(environ.get('MONGODB_MIN_POOL_SIZE', '20')),
+    'connect': False
+}
+
 if 'MONGODB_USER' in environ and 'MONGODB_PASSWORD' in environ:
-    me.connect(environ.get('MONGODB_DATABASE'),
-               host=environ.get('MONGODB_HOST', 'localhost'),
-               port=int(environ.get('MONGODB_PORT', '27017')),
-               username=environ.get('MONGODB_USER'),
-               password=environ.get('MONGODB_PASSWORD'),
-               connect=False)
-else:
-    me.connect(environ.get('MONGODB_DATABASE'),
-               host=environ.get('MONGODB_HOST', 'localhost'),
-               port=int(environ.get('MONGODB_PORT', '27017')),
-               connect=False)
+    connection_settings['username'] = environ.get('MONGODB_USER')
+    connection_settings['password'] = environ.get('MONGODB_PASSWORD')
+
+me.connect(environ.get('MONGODB_DATABASE'), **connection_settings)
+
+# measurements are written with an unacknowledged write concern by default (w=0)
+me.connect(environ.get('MONGODB_DATABASE'),
+           alias='fast_writes',
+           w=int(environ.get('MONGODB_MEASUREMENTS_WRITE_CONCERN', '0')),
+           **connection_settings)
 
 
 class Source(me.Document):
-    meta = {'collection': 'sources'}
+    meta = {
+        'collection': 'sources',
+        'indexes': [{'fields': ('imei', 'imsi'), 'unique': True}]
+    }
     imei = me.StringField(required=True)
     imsi = me.StringField(required=True)
     readable_name = me.StringField(required=True)
@@ -57,7 +102,11 @@ class LocationInformation(me.EmbeddedDocument):
 
 
 class Measurement(me.Document):
-    meta = {'collection': 'measurements'}
+    meta = {
+        'collection': 'measurements',
+        'db_alias': 'fast_writes',
+        'indexes': [('location_information.latitude', 'location_information.longitude')]
+    }
     version = me.StringField(required=True)
     source_id = me.ObjectIdField(required=True)
     timestamp = me.DateTimeField(required=True)
@@ -67,9 +116,13 @@ class Measurement(me.Document):
 
 
 class ValidationModelSchema(ModelSchema):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.field_name_set = frozenset(self.fields)
+
     @validates_schema(pass_original=True)
     def check_unknown_fields(self, data, original_data):
-        unexpected = set(original_data) - set(self.fields)
+        unexpected = original_data.keys() - self.field_name_set
         if unexpected:
             raise ValidationError('Received data for unexpected field.', unexpected)
 
@@ -88,14 +141,260 @@ class AuthSchema(SourceSchema):
         raise error
 
 
-class MeasurementSchema(ValidationModelSchema):
-    class Meta:
-        model = Measurement
+# creates the schema instance on first use instead of at import time
+def lazy_schema(schema_class):
+    instance = []
+    lock = Lock()
+
+    def get_schema():
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(schema_class())
+        return instance[0]
+
+    return get_schema
+
+
+# bounded cache of schema instances restricted to the fields present in a request, keyed only by declared
+# fields so that unknown keys never create entries; required fields are always kept so that missing data is
+# still reported
+def schema_cache(schema_class, maxsize=32):
+    default_schema = lazy_schema(schema_class)
+
+    @lru_cache(maxsize=None)
+    def field_sets():
+        schema_fields = default_schema().fields
+        return (frozenset(schema_fields),
+                frozenset(name for name, field in schema_fields.items() if field.required))
+
+    @lru_cache(maxsize=maxsize)
+    def restricted_schema(only):
+        return schema_class(only=only)
+
+    def schema_for(keys):
+        declared_fields, required_fields = field_sets()
+        return restricted_schema((keys & declared_fields) | required_fields)
+
+    return schema_for
+
+
+source_schema = lazy_schema(SourceSchema)
+auth_schema = lazy_schema(AuthSchema)
+
+
+# validates request data against the mongoengine field definitions and converts it into a document ready
+# for insertion, bypassing marshmallow schemas and mongoengine document hydration on the write path;
+# values are deserialized by the marshmallow field a ModelSchema would use, so coercion and errors stay the same
+def load_document(document_class, data):
+    errors = {}
+    document = convert_document(document_class, data, errors)
+    if errors:
+        raise ValidationError(errors)
+    return document
+
+
+def convert_document(document_class, data, errors):
+    if not isinstance(data, dict):
+        errors['_schema'] = ['Invalid input type.']
+        return None
+
+    document_fields = {name: field for name, field in document_class._fields.items()
+                       if name != document_class._meta.get('id_field')}
+
+    for name in data.keys() - document_fields.keys():
+        errors[name] = ['Unknown field.']
 
+    values = {}
+    for name, field in document_fields.items():
+        value = data.get(name)
 
-source_schema = SourceSchema()
-auth_schema = AuthSchema()
-measurement_schema = MeasurementSchema()
+        if value is None:
+            if field.required:
+                errors[name] = ['Field may not be null.' if name in data else 'Missing data for required field.']
+            continue
+
+        field_errors = {}
+        if isinstance(field, me.EmbeddedDocumentListField):
+            if isinstance(value, list):
+                value = convert_documents(field.field.document_type, value, field_errors)
+            else:
+                field_errors = ['Not a valid list.']
+        elif isinstance(field, me.EmbeddedDocumentField):
+            value = convert_document(field.document_type, value, field_errors)
+        else:
+            try:
+                value = convert_value(field, value)
+            except ValidationError as error:
+                field_errors = error.messages
+
+        if field_errors:
+            errors[name] = field_errors
+        else:
+            values[field.db_field] = value
+
+    return values
+
+
+def convert_documents(document_class, data, errors):
+    documents = []
+    for index, item in enumerate(data):
+        item_errors = {}
+        documents.append(convert_document(document_class, item, item_errors))
+        if item_errors:
+            errors[index] = item_errors
+    return documents
+
+
+def convert_value(field, value):
+    value = marshmallow_field(field).deserialize(value)
+    try:
+        field._validate(value)
+    except me.ValidationError as error:
+        raise ValidationError(error.message)
+    return field.to_mongo(value)
+
+
+@lru_cache(maxsize=None)
+def marshmallow_field(field):
+    return convert_field(field)
+
+
+# generates a dump function specialised to the (fixed) mongoengine field definitions once at import time,
+# producing the same output as a marshmallow ModelSchema dump without walking its fields on every call:
+# values in DUMP_SKIP_VALUES are left out like ModelSchema's model_skip_values, naive datetimes are UTC
+DUMP_SKIP_VALUES = (None, [], {})
+
+
+def compile_dumper(document_class, namespace):
+    function_name = 'dump_{0}'.format(document_class.__name__)
+
+    if function_name not in namespace:
+        lines = ['def {0}(document):'.format(function_name),
+                 '    dumped = {}']
+        for name, field in document_class._fields.items():
+            lines.append('    value = document.{0}'.format(name))
+            expression = dump_expression(field, namespace)
+            if expression is not None:
+                lines.append('    if value is not None:')
+                lines.append('        value = {0}'.format(expression))
+            lines.append('    if value not in skip_values:')
+            lines.append('        dumped[{0!r}] = value'.format(name))
+        lines.append('    return dumped')
+
+        namespace.setdefault('skip_values', DUMP_SKIP_VALUES)
+        namespace.setdefault('utc', timezone.utc)
+        exec(compile('\n'.join(lines) + '\n', '<{0}>'.format(function_name), 'exec'), namespace)
+
+    return function_name
+
+
+def dump_expression(field, namespace):
+    if isinstance(field, me.EmbeddedDocumentListField):
+        return '[{0}(item) for item in value]'.format(compile_dumper(field.field.document_type, namespace))
+    if isinstance(field, me.EmbeddedDocumentField):
+        return '{0}(value)'.format(compile_dumper(field.document_type, namespace))
+    if isinstance(field, me.DateTimeField):
+        return '(value if value.tzinfo else value.replace(tzinfo=utc)).isoformat()'
+    if isinstance(field, me.ObjectIdField):
+        return 'str(value)'
+    return None
+
+
+dumpers = {}
+dump_measurement = dumpers[compile_dumper(Measurement, dumpers)]
+
+
+MEASUREMENT_BATCH_SIZE = 1000
+MEASUREMENT_BUFFER_LIMIT = int(environ.get('MEASUREMENT_BUFFER_LIMIT', '10000'))
+MEASUREMENT_FLUSH_INTERVAL = int(environ.get('MEASUREMENT_FLUSH_INTERVAL_MS', '500')) / 1000
+DUPLICATE_KEY_ERROR = 11000
+
+measurement_buffer = deque()
+measurement_buffer_lock = Lock()
+measurement_flush_timer = None
+
+
+def insert_measurements(measurements):
+    if not measurements:
+        return []
+    return Measurement._get_collection().insert_many(measurements, ordered=False).inserted_ids
+
+
+def flush_measurement_buffer():
+    global measurement_flush_timer
+
+    with measurement_buffer_lock:
+        measurements = list(measurement_buffer)
+        measurement_buffer.clear()
+        if measurement_flush_timer is not None:
+            measurement_flush_timer.cancel()
+            measurement_flush_timer = None
+
+    try:
+        insert_measurements(measurements)
+    except BulkWriteError as error:
+        # rejected documents would be rejected again, duplicates were stored by an earlier partial attempt
+        rejected = [write_error for write_error in error.details['writeErrors']
+                    if write_error['code'] != DUPLICATE_KEY_ERROR]
+        if rejected:
+            app.logger.error("Dropped %d buffered measurements rejected by the database, first error: %s",
+                             len(rejected), rejected[0]['errmsg'])
+    except Exception:
+        app.logger.exception("Inserting %d buffered measurements failed, re-queueing them", len(measurements))
+        requeue_measurements(measurements)
+
+
+def requeue_measurements(measurements):
+    with measurement_buffer_lock:
+        measurement_buffer.extendleft(reversed(measurements))
+
+        dropped = len(measurement_buffer) - MEASUREMENT_BUFFER_LIMIT
+        for _ in range(dropped):
+            measurement_buffer.popleft()
+
+        start_flush_timer()
+
+    if dropped > 0:
+        app.logger.error("Measurement buffer limit of %d reached, dropped %d oldest measurements",
+                         MEASUREMENT_BUFFER_LIMIT, dropped)
+
+
+# must be called with measurement_buffer_lock held
+def start_flush_timer():
+    global measurement_flush_timer
+
+    # timer is started lazily so that it lives in the (forked) worker process, not the preloading master
+    if measurement_flush_timer is None:
+        measurement_flush_timer = Timer(MEASUREMENT_FLUSH_INTERVAL, flush_measurement_buffer)
+        measurement_flush_timer.daemon = True
+        measurement_flush_timer.start()
+
+
+def buffer_measurement(measurement):
+    with measurement_buffer_lock:
+        measurement_buffer.append(measurement)
+
+        # only the request completing a batch flushes it, a backlog left by a failed flush is retried by the timer
+        flush_now = len(measurement_buffer) == MEASUREMENT_BATCH_SIZE
+        if not flush_now:
+            start_flush_timer()
+
+    if flush_now:
+        flush_measurement_buffer()
+
+
+atexit.register(flush_measurement_buffer)
+
+
+# encodes results one by one so that large result sets never have to be held in memory as a whole
+def stream_results(count, results):
+    yield '{{"len":{0},"results":['.format(count)
+    for index, result in enumerate(results):
+        if index:
+            yield ','
+        yield json.dumps(result)
+    yield '],"status":200}'
 
 
 @app.errorhandler(me.ValidationError)
@@ -120,68 +419,161 @@ def handle_generic_error(error):
             500)
 
 
+# (source id, readable name) of recently authenticated sources, keyed by (imei, imsi)
+source_id_cache = TTLCache(maxsize=int(environ.get('SOURCE_CACHE_SIZE', '10000')),
+                           ttl=int(environ.get('SOURCE_CACHE_TTL', '300')))
+source_id_cache_lock = Lock()
+
+# constant responses are encoded once at import time
+WRONG_PSK_RESPONSE = (orjson.dumps({'message': "No or wrong PSK provided.", 'status': 403}),
+                      403,
+                      {'Content-Type': 'application/json'})
+MEASUREMENT_CREATED_RESPONSE = (orjson.dumps({'status': 201}),
+                                201,
+                                {'Content-Type': 'application/json'})
+
+
 @routing_blueprint.route('/auth', methods=['POST'])
 def auth():
-    auth_schema.validate(request.json)
-    source = source_schema.load({key: request.json[key] for key in request.json if key != 'psk'})
+    auth_schema().validate(request.json)
+    source = source_schema().load({key: request.json[key] for key in request.json if key != 'psk'})
 
-    if request.json['psk'] != environ.get('AUTH_PSK', 'defaultpsk'):
-        return (jsonify(status=403,
-                        message="No or wrong PSK provided."),
-                403)
+    psk = request.json['psk']
+    if not isinstance(psk, str) or not hmac.compare_digest(psk.encode(), AUTH_PSK):
+        return WRONG_PSK_RESPONSE
 
-    try:
-        existing_source_record = Source.objects.get(imei=source.imei,
-                                                    imsi=source.imsi)
+    source.validate()
+
+    source_key = (source.imei, source.imsi)
+    with source_id_cache_lock:
+        cached_source = source_id_cache.get(source_key)
 
-        # update readable name in case it changed
-        existing_source_record.readable_name = source.readable_name
-        existing_source_record.save()
+    # a known source with an unchanged name skips the round-trip; it is still upserted unacknowledged, since
+    # other workers' caches or a rename in between may have left a different name in the database and a
+    # deleted source has to come back with the id the device was given
+    if cached_source is not None and cached_source[1] == source.readable_name:
+        source_id = cached_source[0]
+        Source._get_collection().with_options(write_concern=WriteConcern(w=0)).update_one(
+            {'imei': source.imei, 'imsi': source.imsi},
+            {'$set': {'readable_name': source.readable_name}, '$setOnInsert': {'_id': ObjectId(source_id)}},
+            upsert=True)
 
         return (jsonify(status=200,
-                        source_id=str(existing_source_record.id)),
+                        source_id=source_id),
                 200)
-    except me.DoesNotExist:
-        source.save()
 
-        return (jsonify(status=201,
-                        source_id=str(source.id)),
-                201)
+    # single atomic round-trip: update the readable name in case it changed or create the source,
+    # the pre-generated id tells whether the record was inserted
+    new_source_id = ObjectId()
+    source_record = Source._get_collection().find_one_and_update(
+        {'imei': source.imei, 'imsi': source.imsi},
+        {'$set': {'readable_name': source.readable_name}, '$setOnInsert': {'_id': new_source_id}},
+        projection={'_id': True},
+        upsert=True,
+        return_document=ReturnDocument.AFTER)
+
+    status_code = 201 if source_record['_id'] == new_source_id else 200
+    source_id = str(source_record['_id'])
+
+    with source_id_cache_lock:
+        source_id_cache[source_key] = (source_id, source.readable_name)
+
+    return (jsonify(status=status_code,
+                    source_id=source_id),
+            status_code)
 
 
 @routing_blueprint.route('/measurements', methods=['POST'])
 def post_measurement():
-    measurement = measurement_schema.load(request.json)
-    measurement.save()
+    # a list of measurements is written right away as one batch, single measurements are buffered
+    if isinstance(request.json, list):
+        return post_measurement_batch(request.json)
+
+    measurement = load_document(Measurement, request.json)
+    buffer_measurement(measurement)
+
+    return MEASUREMENT_CREATED_RESPONSE
 
-    return (jsonify(status=201),
+
+@routing_blueprint.route('/measurements/bulk', methods=['POST'])
+def post_measurements():
+    if not isinstance(request.json, dict) or not isinstance(request.json.get('measurements'), list):
+        raise ValidationError('Expected a list of measurements.', 'measurements')
+
+    return post_measurement_batch(request.json['measurements'], 'measurements')
+
+
+def post_measurement_batch(data, field_name=None):
+    errors = {}
+    measurements = convert_documents(Measurement, data, errors)
+    if errors:
+        raise ValidationError({field_name: errors} if field_name else errors)
+
+    measurement_ids = insert_measurements(measurements)
+
+    return (jsonify(status=201,
+                    len=len(measurement_ids),
+                    measurement_ids=measurement_ids),
             201)
 
 
+# projections are applied by the database and the returned documents are passed on without hydration
+def measurement_projection(measurement_fields):
+    return {'_id' if field == 'id' else field: True for field in measurement_fields.split(',')}
+
+
+def raw_measurement(measurement):
+    measurement['id'] = measurement.pop('_id')
+    return skip_empty_values(Measurement, measurement)
+
+
+# leaves out DUMP_SKIP_VALUES like the generated dumpers, descending into embedded documents only
+def skip_empty_values(document_class, document):
+    skipped = {}
+    for name, value in document.items():
+        field = document_class._fields.get(name)
+        if isinstance(field, me.EmbeddedDocumentListField):
+            value = [skip_empty_values(field.field.document_type, item) for item in value]
+        elif isinstance(field, me.EmbeddedDocumentField):
+            value = skip_empty_values(field.document_type, value)
+
+        if value not in DUMP_SKIP_VALUES:
+            skipped[name] = value
+
+    return skipped
+
+
 class GetMeasurementSchema(ModelSchema):
     measurement_fields = fields.String()
 
 
-get_measurement_schema = GetMeasurementSchema()
+get_measurement_schema = lazy_schema(GetMeasurementSchema)
 
 
 @routing_blueprint.route('/measurement/<measurement_id>', methods=['GET'])
 def get_measurement(measurement_id):
-    parameters = get_measurement_schema.load(request.args)
+    parameters = get_measurement_schema().load(request.args)
 
-    try:
-        measurement = Measurement.objects(id=measurement_id)
-        if 'measurement_fields' in parameters:
-            measurement = measurement.only(*parameters['measurement_fields'].split(','))
-
-        return (jsonify(status=200,
-                        result=measurement_schema.dump(measurement.get())),
-                200)
-
-    except me.DoesNotExist:
-        return (jsonify(status=404,
-                        message="Measurement with object id {0} was not found.".format(measurement_id)),
-                404)
+    if 'measurement_fields' in parameters:
+        measurement = Measurement._get_collection().find_one(
+            {'_id': Measurement._fields['id'].to_mongo(measurement_id)},
+            measurement_projection(parameters['measurement_fields']))
+
+        if measurement is not None:
+            return (jsonify(status=200,
+                            result=raw_measurement(measurement)),
+                    200)
+    else:
+        try:
+            return (jsonify(status=200,
+                            result=dump_measurement(Measurement.objects.get(id=measurement_id))),
+                    200)
+        except me.DoesNotExist:
+            pass
+
+    return (jsonify(status=404,
+                    message="Measurement with object id {0} was not found.".format(measurement_id)),
+            404)
 
 
 class GetMeasurementsSchema(ModelSchema):
@@ -211,38 +603,54 @@ class GetMeasurementsSchema(ModelSchema):
             raise ValidationError("min_location_accuracy must be smaller than max_location_accuracy.")
 
 
-get_measurements_schema = GetMeasurementsSchema()
+get_measurements_schema_for = schema_cache(GetMeasurementsSchema)
+
+
+MEASUREMENTS_QUERY_CONDITIONS = {
+    'latitude_upper_bound': ('location_information.latitude', '$lte'),
+    'latitude_lower_bound': ('location_information.latitude', '$gte'),
+    'longitude_lower_bound': ('location_information.longitude', '$gte'),
+    'longitude_upper_bound': ('location_information.longitude', '$lte'),
+    'min_location_age': ('location_information.age', '$gte'),
+    'max_location_age': ('location_information.age', '$lte'),
+    'min_location_accuracy': ('location_information.accuracy', '$gte'),
+    'max_location_accuracy': ('location_information.accuracy', '$lte')
+}
+
+
+# compiles a function assembling the raw mongo query for one set of given parameters
+@lru_cache(maxsize=32)
+def measurements_query_builder(parameter_names):
+    conditions = {}
+    for parameter_name in sorted(parameter_names & MEASUREMENTS_QUERY_CONDITIONS.keys()):
+        path, operator = MEASUREMENTS_QUERY_CONDITIONS[parameter_name]
+        conditions.setdefault(path, []).append('{0!r}: parameters[{1!r}]'.format(operator, parameter_name))
+
+    return eval('lambda parameters: {{{0}}}'.format(
+        ', '.join('{0!r}: {{{1}}}'.format(path, ', '.join(operators)) for path, operators in conditions.items())))
 
 
 @routing_blueprint.route('/measurements', methods=['GET'])
 def get_measurements():
-    parameters = get_measurements_schema.load(request.args)
-    mongoquery_parameters = {
-        'location_information__latitude__lte': parameters['latitude_upper_bound'],
-        'location_information__latitude__gte': parameters['latitude_lower_bound'],
-        'location_information__longitude__gte': parameters['longitude_lower_bound'],
-        'location_information__longitude__lte': parameters['longitude_upper_bound']
-    }
-    if 'min_location_age' in parameters:
-        mongoquery_parameters['location_information__age__gte'] = parameters['min_location_age']
-    if 'max_location_age' in parameters:
-        mongoquery_parameters['location_information__age__lte'] = parameters['max_location_age']
-    if 'min_location_accuracy' in parameters:
-        mongoquery_parameters['location_information__accuracy__gte'] = parameters['min_location_accuracy']
-    if 'max_location_accuracy' in parameters:
-        mongoquery_parameters['location_information__accuracy__lte'] = parameters['max_location_accuracy']
-
-    measurements = Measurement.objects(**mongoquery_parameters)
+    parameters = get_measurements_schema_for(frozenset(request.args)).load(request.args)
+    query = measurements_query_builder(frozenset(parameters))(parameters)
+
+    measurements = Measurement.objects(__raw__=query)
+    count = measurements.count()
+
     if 'measurement_fields' in parameters:
-        measurements = measurements.only(*parameters['measurement_fields'].split(','))
+        cursor = Measurement._get_collection().find(query,
+                                                    measurement_projection(parameters['measurement_fields']))
+        results = (raw_measurement(measurement) for measurement in cursor.batch_size(500))
+    else:
+        results = (dump_measurement(measurement) for measurement in measurements.no_cache().batch_size(500))
 
-    return (jsonify(status=200,
-                    len=len(measurements),
-                    results=measurement_schema.dump(measurements.all(), many=True)),
-            200)
+    return Response(stream_with_context(stream_results(count, results)),
+                    status=200,
+                    mimetype='application/json')
 
 
-app.register_blueprint(routing_blueprint, url_prefix=environ.get('API_ROOT', ''))
+app.register_blueprint(routing_blueprint, url_prefix=API_ROOT)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', debug=False)
@@ -0,0 +1,6 @@
+# gevent has to patch the standard library before pymongo is imported, so that
+# concurrent requests can overlap their database round-trips within one worker
+from gevent import monkey
+monkey.patch_all()
+
+from cellidtracker_rest_api import app  # noqa: E402,F401